@@ -1,20 +1,137 @@
 """Flask application powering the Driver Checker backend."""
 from __future__ import annotations
 
+import atexit
+import importlib
+import logging
 import os
+import queue
+import sys
+from logging.handlers import QueueHandler, QueueListener
 from typing import Any, Dict
 
+import orjson
 from flask import Flask, jsonify
+from flask.json.provider import DefaultJSONProvider
+from flask.logging import default_handler
 from flask_cors import CORS
 
+CORS_MAX_AGE = 86400
+COMPACT_SEPARATORS = (",", ":")
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """:class:`DefaultJSONProvider` that encodes and decodes with :mod:`orjson`.
+
+    Calls using only the arguments Flask itself passes for responses
+    (``indent=2`` or compact ``separators``) go through orjson, with
+    :attr:`default` and :attr:`sort_keys` applied as usual. Any other
+    arguments, such as the ``object_hook`` used by the session
+    serializer, fall back to the stdlib implementation. Output is UTF-8
+    rather than ASCII-escaped.
+    """
+
+    ensure_ascii = False
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        if not _orjson_can_dump(kwargs):
+            return super().dumps(obj, **kwargs)
+
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if kwargs.get("indent"):
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=self.default, option=option).decode()
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        if kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+
+
+def _orjson_can_dump(kwargs: Dict[str, Any]) -> bool:
+    """Return whether ``json.dumps`` arguments have an orjson equivalent."""
+    if not kwargs.keys() <= {"indent", "separators"}:
+        return False
+    if "indent" in kwargs:
+        return kwargs["indent"] in (None, 2) and "separators" not in kwargs
+    return kwargs.get("separators", COMPACT_SEPARATORS) == COMPACT_SEPARATORS
+
+
+def _unpatched(module: str, name: str) -> Any:
+    """Return ``module.name`` as it was before any gevent monkey-patching."""
+    monkey = sys.modules.get("gevent.monkey")
+    if monkey is None:
+        return getattr(importlib.import_module(module), name)
+    return monkey.get_original(module, name)
+
+
+class NativeQueueListener(QueueListener):
+    """:class:`QueueListener` whose worker always runs on a native thread.
+
+    Once gevent has patched :mod:`threading`, the stock listener's thread
+    is a greenlet on the hub, so a blocked write would stall every request.
+    In that case the worker runs in a single-thread gevent ``ThreadPool``.
+    """
+
+    _pool: Any = None
+
+    def start(self) -> None:
+        monkey = sys.modules.get("gevent.monkey")
+        if monkey is None or not monkey.is_module_patched("threading"):
+            super().start()
+            return
+
+        from gevent.threadpool import ThreadPool
+
+        self._pool = ThreadPool(1)
+        self._pool.spawn(self._monitor)
+
+    def stop(self) -> None:
+        if self._pool is None:
+            super().stop()
+            return
+
+        self.enqueue_sentinel()
+        self._pool.join()
+        self._pool.kill()
+        self._pool = None
+
+
+def configure_logging(app: Flask) -> None:
+    """Route ``app.logger`` through a queue so emitting never blocks a request."""
+    if any(isinstance(handler, QueueHandler) for handler in app.logger.handlers):
+        return
+
+    # The handler and queue are used from the listener's native thread, so
+    # they must not be built on gevent's cooperative primitives.
+    stream_handler = logging.StreamHandler()
+    stream_handler.lock = _unpatched("_thread", "RLock")()
+    stream_handler.setFormatter(default_handler.formatter)
+    log_queue: queue.SimpleQueue[logging.LogRecord] = _unpatched(
+        "queue", "SimpleQueue"
+    )()
+    listener = NativeQueueListener(log_queue, stream_handler)
+    listener.start()
+    atexit.register(listener.stop)
+
+    app.logger.removeHandler(default_handler)
+    app.logger.addHandler(QueueHandler(log_queue))
+    app.logger.propagate = False
+
 
 def create_app() -> Flask:
     """Create and configure the Flask application instance."""
     app = Flask(__name__)
+    app.json = OrjsonProvider(app)
+    configure_logging(app)
 
     cors_origin = os.getenv("FRONTEND_ORIGIN")
+    if not cors_origin:
+        raise RuntimeError("FRONTEND_ORIGIN must be set to the frontend's origin.")
     cors_resources: Dict[str, Dict[str, Any]] = {
-        r"/api/*": {"origins": cors_origin or "*"}
+        r"/api/*": {"origins": cors_origin, "max_age": CORS_MAX_AGE}
     }
     CORS(app, resources=cors_resources)
 
@@ -36,5 +153,4 @@ app = create_app()
 
 
 if __name__ == "__main__":
-    port = int(os.getenv("PORT", "5000"))
-    app.run(host="0.0.0.0", port=port)
+    sys.exit("Run the backend with 'python serve.py' instead of app.py.")
@@ -0,0 +1,3 @@
+import os
+
+os.environ.setdefault("FRONTEND_ORIGIN", "http://localhost:3000")
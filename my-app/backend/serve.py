@@ -0,0 +1,20 @@
+"""Production entry point serving the Driver Checker backend with gevent.
+
+gevent must patch the standard library before Flask, ``requests`` or any
+other module binds socket, ssl or threading objects, so the patch runs
+ahead of every other import here.
+"""
+from gevent import monkey
+
+monkey.patch_all()
+
+import os  # noqa: E402
+
+from gevent.pywsgi import WSGIServer  # noqa: E402
+
+from app import app  # noqa: E402
+
+
+if __name__ == "__main__":
+    port = int(os.getenv("PORT", "5000"))
+    WSGIServer(("0.0.0.0", port), app).serve_forever()
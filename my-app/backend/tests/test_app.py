@@ -0,0 +1,33 @@
+from decimal import Decimal
+
+from flask import jsonify, session
+
+from app import create_app
+
+
+def test_session_cookie_round_trip():
+    app = create_app()
+    app.secret_key = "test"
+
+    @app.post("/session")
+    def store() -> str:
+        session["driver"] = {"name": "Łukasz", "checked": (1, 2)}
+        return ""
+
+    @app.get("/session")
+    def load() -> dict:
+        return dict(session)
+
+    client = app.test_client()
+    assert client.post("/session").status_code == 200
+    response = client.get("/session")
+    assert response.json == {"driver": {"name": "Łukasz", "checked": [1, 2]}}
+
+
+def test_jsonify_matches_default_provider():
+    app = create_app()
+
+    with app.app_context():
+        response = jsonify({"b": Decimal("1.5"), "a": 1})
+
+    assert response.get_data(as_text=True) == '{"a":1,"b":"1.5"}\n'